@@ -2,10 +2,32 @@
 datacsv is very lightweight and zero dependency file based database system 
 that store data in csv file and provide various operation to perform on database.
 """
+import io
 import os
+import glob
+import bisect
+import pickle
 import csv
+import mmap
+import operator
+import math
+import sqlite3
+import time
+import functools
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from typing import Collection
 
+try:
+    import pandas as pd
+except ImportError:  # optional, only needed for find_where(..., engine='pandas') and find_where_typed
+    pd = None
+
+try:
+    import cloudpickle
+except ImportError:  # optional, lets find_where(..., parallel=True) ship lambdas to worker processes
+    cloudpickle = None
+
 class CSVDatabase:
     """😎 Creating a lightweight, zero-dependency, file-based database system in 
     Python using CSV as the storage backend is a great idea for small-scale applications or CLI tools.
@@ -14,20 +36,59 @@ class CSVDatabase:
         logs and retrieve 
         basic details 
         microservices logs
-        basic user data inputs"""
+        basic user data inputs
+    Pass `backend='sqlite'` to keep the same API on top of a SQLite file instead of a CSV file."""
+
+    # deleted rows are compacted away once they exceed this share of all rows
+    TOMBSTONE_RATIO = 0.25
+    # buffer for opens that stream a whole file (scans, exports, vacuum, index files),
+    # the default 8 KiB costs one read() syscall per 8 KiB
+    READ_BUFFER = 1 << 20
+    # find_all keeps the parsed rows in memory as one list per column so later reads skip
+    # csv parsing until the next write, turn it off for files too large to hold in memory
+    COLUMN_CACHE = True
+
+    _OPERATORS = {
+        "==": operator.eq, "!=": operator.ne,
+        "<": operator.lt, "<=": operator.le,
+        ">": operator.gt, ">=": operator.ge,
+    }
+
+    # per-process handles, left out of copies and pickles and reopened on first use
+    _HANDLES = ('_mmap', '_mmap_stamp', '_offsets', '_append_fd', '_append_finalizer')
 
-    def __init__(self, db_name: str, headers:Collection[str]=[]):
+    def __new__(cls, *args, **kwargs):
+        # copy and pickle call __new__ without arguments
+        backend = kwargs.get('backend', args[2] if len(args) > 2 else 'csv')
+        if backend not in ('csv', 'sqlite'):
+            raise ValueError(f"Unknown backend '{backend}', use 'csv' or 'sqlite'.")
+        if backend == 'sqlite' and cls is CSVDatabase:
+            cls = _SQLiteBackend
+        return super().__new__(cls)
+
+
+    def __init__(self, db_name: str, headers:Collection[str]=[], backend:str='csv'):
         """You need🤞 2 inputs as an argument to create object of datacsv.
             1. Database name - You have to provide database name in string format
-            2. Fields - Headers for table that needed to perform query and update operation"""
+            2. Fields - Headers for table that needed to perform query and update operation
+            3. Optional backend - 'csv' (default) or 'sqlite' to store rows in `<db_name>.db`"""
         self.db_name = db_name if db_name.endswith(".csv") else db_name + ".csv"
         self.headers = headers
+        self._tombstones = 0
+        self._mmap = None
+        self._mmap_stamp = None
+        self._offsets = None
+        self._columns = None
+        self._columns_stamp = None
+        self._cast_columns = {}
+        self._indexes = {}
+        self._append_fd = None
+        self._append_finalizer = None
 
         if not os.path.exists(self.db_name):
             if headers:
                 with open(self.db_name, mode='w', newline='', encoding='UTF-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=headers, quoting=csv.QUOTE_MINIMAL)
-                    writer.writeheader()
+                    csv.writer(f, quoting=csv.QUOTE_MINIMAL).writerow(headers)
             else:
                 raise ValueError("""CSVDatabase: Database does not exist, provide fields to create it.
                                     You must provide Database name in String and fields in List 
@@ -39,6 +100,7 @@ class CSVDatabase:
                 raise FileNotFoundError("""CSVDatabase: Database is empty. provide fields to create it.\n
                                     Your database should not be empty\n
                                     Create new database with: db = CSVDatabase('my_database.csv',['field1,'field2','field3'])""")
+        self._set_headers()
 
 
     def insert(self, row:dict,fill_missing:bool=False)-> bool:
@@ -65,18 +127,97 @@ class CSVDatabase:
         if fill_missing:
             row = {key: row.get(key, "") for key in self.headers}
         else:
-            missing_keys = [key for key in self.headers if key not in row]
+            missing_keys = self._headers_set.difference(row)
             if missing_keys:
-                raise ValueError(f"Missing keys in row: {missing_keys}")
+                raise ValueError(f"Missing keys in row: {sorted(missing_keys)}")
         # validate extra keys and raise error if user entered extra keys
-        extra_keys = [key for key in row if key not in self.headers]
+        extra_keys = row.keys() - self._headers_set
         if extra_keys:
             raise KeyError("""Unexpected keys in row: {extra_keys}.
             Your keys must be same as your fields.""")
-        with open(self.db_name, mode='a', newline='',encoding='UTF-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.headers, quoting=csv.QUOTE_MINIMAL)
-            writer.writerow(row)
-            return True
+        self._close_mmap()
+        stamp = self._sync_indexes()
+        fields = [row[h] for h in self._headers_tuple]
+        buf = self._render(fields)
+        fd = self._appender()
+        written = os.write(fd, buf)
+        if self._indexes:
+            # read back where O_APPEND put the record, another process may have appended since the stat
+            offset = os.lseek(fd, 0, os.SEEK_CUR) - written
+        while written < len(buf):
+            written += os.write(fd, buf[written:])
+        if self._indexes:
+            if offset == stamp[1]:
+                self._reindex(added=[(offset, fields)])
+            else:
+                # rows appended in between are not in the indexes, leave them to be rebuilt
+                self._indexes = {}
+        return True
+
+
+    def insert_many(self, rows:Collection[dict], fill_missing:bool=False)-> bool:
+        """
+        Perform bulk insert operation to database.
+        insert_many accept rows as list of dict, fill_missing in boolean.
+        All rows are validated first and then written with a single file open,
+        so either every row is inserted or none of them.
+        example:
+        ```
+        insert_many([{'id': 1, 'name': 'Alice'}, {'id': 2, 'name': 'Bob'}])
+        ```
+        """
+        normalized = []
+        for row in rows:
+            if not isinstance(row, dict):
+                raise TypeError(f"""Your provided row is not in dictionary format.
+                Your input row: {row}
+                Check your input row is valid dict or not.""")
+            if not row:
+                raise ValueError(f"""Your provided row empty.
+                Your input row: {row}
+                Check your input row has valid data or not.""")
+            if fill_missing:
+                row = {key: row.get(key, "") for key in self.headers}
+            else:
+                missing_keys = self._headers_set.difference(row)
+                if missing_keys:
+                    raise ValueError(f"Missing keys in row: {sorted(missing_keys)}")
+            extra_keys = row.keys() - self._headers_set
+            if extra_keys:
+                raise KeyError(f"""Unexpected keys in row: {list(extra_keys)}.
+                Your keys must be same as your fields.""")
+            normalized.append([row[h] for h in self._headers_tuple])
+        if not normalized:
+            return False
+        self._write_rows(normalized)
+        return True
+
+
+    def insert_rows_raw(self, rows:Collection[list|tuple])-> bool:
+        """
+        Fastest bulk insert, rows are lists or tuples of values already ordered like the headers.
+        No dict is built or checked per row, only the number of values is validated.
+        example:
+        ```
+        db = CSVDatabase('user.csv',['id','name'])
+        db.insert_rows_raw([[1, 'Alice'], [2, 'Bob']])
+        ```
+        """
+        width = len(self._headers_tuple)
+        rows = rows if isinstance(rows, list) else list(rows)
+        for row in rows:
+            if not isinstance(row, (list, tuple)):
+                raise TypeError(f"""Your provided row is not a list or tuple.
+                Your input row: {row}
+                Use insert_many for rows in dictionary format.""")
+            if len(row) != width:
+                raise ValueError(f"""Row has {len(row)} values, expected {width}.
+                Your input row: {row}
+                Values must follow the order of your fields: {list(self._headers_tuple)}""")
+        if not rows:
+            return False
+        self._write_rows(rows)
+        return True
 
 
     def find_all(self, key: str|None = None) -> list:
@@ -90,16 +231,21 @@ class CSVDatabase:
         db.find_all('name')
         ```
         """
-        with open(self.db_name, mode='r', newline='', encoding='UTF-8') as f:
-            reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
-            rows = [{k: self._auto_cast(v) for k, v in row.items()} for row in reader]
+        if key is not None:
+            if key not in self._headers_set:
+                raise KeyError(f"Field '{key}' does not exist in the database headers.")
+            col_idx = self._header_index[key]
+            if key in self._casters:
+                cast_column = self._cast_column(col_idx)
+                if cast_column is not None:
+                    return list(cast_column)
+            cast = self._cast_fns[col_idx]
+            columns = self._column_cache()
+            if columns is not None:
+                return [cast(raw) for raw in columns[col_idx]]
+            return [cast(fields[col_idx]) for fields in self._scan(build=True)]
 
-            if key is not None:
-                if key not in self.headers:
-                    raise KeyError(f"Field '{key}' does not exist in the database headers.")
-                return [self._auto_cast(row.get(key)) for row in rows]
-
-            return rows
+        return [self._cast_row(fields) for fields in self._scan(build=True)]
 
 
 
@@ -107,22 +253,47 @@ class CSVDatabase:
 
     def find(self, key:str, value:str|int|float|bool):
         """
-        used to find row(s) with a specific key and value. Supports type-safe search
+        used to find row(s) with a specific key and value. Supports type-safe search.
+        Uses the index of `key` when one was created with `create_index`, then the column
+        cache when an earlier read already built it, otherwise for string values only the
+        rows whose raw text contains the value are parsed.
         """
         if not key or not value:
             raise ValueError("""You must provide valid key and value to run find method.
             Your input data: KEY: {key} AND VALUE: {value}
             Key or value is missing in your inputs""")
-        with open(self.db_name, mode='r', newline='', encoding='UTF-8') as f:
-            reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
-            return [
-                {k: self._auto_cast(v) for k, v in row.items()}
-                for row in reader
-                if self._auto_cast(row.get(key)) == value
-            ]
+        if key not in self._headers_set:
+            raise KeyError(f"Field '{key}' does not exist in the database headers.")
+        col_idx = self._header_index[key]
+        cast = self._cast_fns[col_idx]
+        if key in self._casters:
+            # a registered caster can turn any text into `value`, so neither the index nor the text search applies
+            cast_column = self._cast_column(col_idx, build=False)
+            if cast_column is None:
+                return [self._cast_row(fields) for fields in self._scan() if cast(fields[col_idx]) == value]
+            columns = self._columns
+            return [self._cast_row([column[i] for column in columns]) for i, v in enumerate(cast_column) if v == value]
+        index = self._get_index(key)
+        columns = self._column_cache(build=False)
+        if index is not None:
+            records = self._read_at(index.get(value, ()))
+            rows = (fields for fields in csv.reader(records, quoting=csv.QUOTE_MINIMAL) if fields)
+        elif columns is not None:
+            if isinstance(value, str):
+                hits = (i for i, raw in enumerate(columns[col_idx]) if raw == value)
+            else:
+                hits = (i for i, raw in enumerate(columns[col_idx]) if self._auto_cast(raw) == value)
+            rows = ([column[i] for column in columns] for i in hits)
+        elif isinstance(value, str) and '"' not in value:
+            # a string can only match a field that holds its exact text
+            records = (raw.decode('UTF-8') for raw in self._candidates(value.encode('UTF-8')))
+            rows = (fields for fields in csv.reader(records, quoting=csv.QUOTE_MINIMAL) if fields)
+        else:
+            rows = self._scan()
+        return [self._cast_row(fields) for fields in rows if cast(fields[col_idx]) == value]
 
 
-    def find_where(self, condition)->list:
+    def find_where(self, condition, engine:str='python', parallel:bool|int=False)->list:
         """
         find_where() condition accept collable function or dictionary to filter the row data from database and return list as output.
         You can pass argument like:
@@ -132,33 +303,88 @@ class CSVDatabase:
                     find_where(name_starts_with_a)
         3. lambda:  find_where(lambda row: int(row["age"]) > 25)
         find_where() has data called 'row' which you can use to perform a conditional operation.
+        `engine='pandas'` matches dictionary conditions with vectorized pandas column comparisons,
+        it needs pandas installed and is useful for large files. Functions always use the python engine.
+        `parallel=True` (or a number of processes) splits the file into chunks scanned by worker processes.
+        Functions must be picklable (defined at module level, or any function when cloudpickle is installed),
+        otherwise the file is scanned in this process.
+        """
+        if condition is None:
+            raise TypeError("Your condition function is none. Function should not be none")
+        if engine not in ('python', 'pandas'):
+            raise ValueError(f"Unknown engine '{engine}', use 'python' or 'pandas'.")
+        if engine == 'pandas' and isinstance(condition, dict):
+            return self._find_where_pandas(condition)
+        if parallel:
+            workers = (os.cpu_count() or 1) if parallel is True else parallel
+            try:
+                dumped = (cloudpickle or pickle).dumps((condition, self._casters))
+            except Exception:
+                dumped = None
+            if dumped is not None and workers > 1:
+                return self._find_where_parallel(dumped, workers)
+        return self._select(self._scan(), condition)
+
+
+    def iter_all(self):
+        """
+        Yield rows one at a time as dictionaries instead of building the whole list like find_all().
+        Memory stays flat however big the file is, and the first row is available right away.
+        ```python
+        for row in db.iter_all():
+            print(row)
+        ```
+        """
+        return map(self._cast_row, self._stream())
+
+
+    def iter_where(self, condition):
+        """
+        Lazy find_where(): yield the rows that match a function or dictionary condition one at a time.
+        The condition is validated immediately, rows are read as you iterate.
+        ```python
+        first_adult = next(db.iter_where(lambda row: row["age"] > 18), None)
+        ```
         """
         if condition is None:
             raise TypeError("Your condition function is none. Function should not be none")
-        with open(self.db_name, 'r', newline='', encoding='UTF-8') as f:
-            reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
-            return [
-                {k: self._auto_cast(v) for k, v in row.items()}
-                for row in reader if self._match(row, condition)
-            ]
+        return self._iter_select(self._stream(), condition)
+
+
+    def find_where_typed(self, key:str, op:str, value:int|float)->list:
+        """
+        find_where_typed() filters on a numeric column with one comparison, like `find_where(lambda row: row["age"] > 25)`
+        but the whole column is compared at once with NumPy instead of calling a function for every row.
+        `op` is one of "==", "!=", "<", "<=", ">", ">=". Rows where `key` is not a number never match.
+        It needs pandas installed.
+        ```python
+        db = CSVDatabase('user.csv',['id','name','age'])
+        db.find_where_typed('age', '>', 25)
+        ```
+        """
+        if op not in self._OPERATORS:
+            raise ValueError(f"Unknown operator '{op}', use one of {list(self._OPERATORS)}")
+        if key not in self._headers_set:
+            raise KeyError(f"Field '{key}' does not exist in the database headers.")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"find_where_typed compares numbers only, got {value!r}")
+        df = self._frame()
+        column = pd.to_numeric(df[key], errors='coerce')
+        mask = column.notna() & self._OPERATORS[op](column, value)
+        return self._frame_rows(df[mask])
 
 
     def delete(self, key:str, value:str|int|float|bool) -> bool:
         """
-        perform delete operation to database
+        perform delete operation to database.
+        Matching rows are overwritten in place with a tombstone, the file is compacted
+        once tombstones pass `TOMBSTONE_RATIO` of all rows (see `vacuum`).
         """
-        if key not in self.headers:
+        if key not in self._headers_set:
             raise KeyError(f"Invalid column name '{key}'")
-        deleted = False
-        with open(self.db_name, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
-            rows = [r for r in reader if not (self._auto_cast(r.get(key)) == value and (deleted := True))]
-        if deleted:
-            with open(self.db_name, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.headers, quoting=csv.QUOTE_MINIMAL)
-                writer.writeheader()
-                writer.writerows(rows)
-        return deleted
+        col_idx = self._header_index[key]
+        cast = self._cast_fns[col_idx]
+        return self._mutate(lambda fields: cast(fields[col_idx]) == value)
 
 
     def delete_where(self, condition)-> bool:
@@ -175,42 +401,23 @@ class CSVDatabase:
         """
         if condition is None:
             raise TypeError("The condition must be a valid dictionary or function. None provided.")
-        found = False
-        with open(self.db_name, 'r', newline='', encoding='UTF-8') as f:
-            reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
-            rows = []
-            for r in reader:
-                if self._match(r, condition):
-                    found = True
-                    continue  
-                rows.append(r)
-        if found:
-            with open(self.db_name, 'w', newline='', encoding='UTF-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.headers, quoting=csv.QUOTE_MINIMAL)
-                writer.writeheader()
-                writer.writerows(rows)
-        return found
+        return self._mutate(self._compile_condition(condition))
 
 
     def update(self, key:str, value:str|int|float|bool, new_data: dict)->bool:
         """
-        Update rows in database
+        Update rows in database.
+        A row is rewritten in place when the updated row has the same byte length,
+        otherwise the old row is tombstoned and the updated row is appended to the end.
         """
-        updated = False
-        rows = []
-        with open(self.db_name, mode='r', newline='', encoding='UTF-8') as f:
-            reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
-            for row in reader:
-                if row.get(key) == value:
-                    row.update(new_data)
-                    updated = True
-                rows.append(row)
-        if updated:
-            with open(self.db_name, mode='w', newline='', encoding='UTF-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.headers, quoting=csv.QUOTE_MINIMAL)
-                writer.writeheader()
-                writer.writerows(rows)
-        return updated
+        for k in new_data:
+            if k not in self._headers_set:
+                raise KeyError(f"Invalid column name: '{k}'")
+        if key not in self._headers_set:
+            return False
+        col_idx = self._header_index[key]
+        return self._mutate(lambda fields: fields[col_idx] == value,
+                            lambda fields: self._merge(fields, new_data))
 
     
     def update_where(self, condition, new_data:dict):
@@ -238,29 +445,128 @@ class CSVDatabase:
         if not isinstance(new_data, dict) or not new_data:
             raise ValueError("new_data must be a non-empty dictionary.")
         for k in new_data:
-            if k not in self.headers:
+            if k not in self._headers_set:
                 raise KeyError(f"Invalid column name: '{k}'")
-        updated = False
-        with open(self.db_name, 'r', newline='', encoding='UTF-8') as f:
-            reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
-            rows = []
-            for r in reader:
-                if self._match(r, condition):
-                    r.update({k: str(v) for k, v in new_data.items()})
-                    updated = True
-                rows.append(r)
-        if updated:
-            with open(self.db_name, 'w', newline='', encoding='UTF-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.headers, quoting=csv.QUOTE_MINIMAL)
-                writer.writeheader()
-                writer.writerows(rows)
-        return updated
+        return self._mutate(self._compile_condition(condition),
+                            lambda fields: self._merge(fields, new_data))
+
+
+    def vacuum(self)->bool:
+        """
+        Compact the database by rewriting it without tombstones left behind by
+        delete and update operations. It runs automatically, but can be called manually.
+        Rows are streamed into `<db_name>.tmp` which then replaces the database, so the
+        original file stays intact if the rewrite is interrupted.
+        """
+        self.close()
+        tmp = self.db_name + '.tmp'
+        try:
+            with open(self.db_name, 'rb', buffering=self.READ_BUFFER) as src, \
+                 open(tmp, 'wb', buffering=self.READ_BUFFER) as dst:
+                self._hint_sequential(src)
+                dst.write(self._read_record(src))
+                dst.writelines(raw for _, raw in self._records(src) if not self._is_tombstone(raw))
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.replace(tmp, self.db_name)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self._tombstones = 0
+        # offsets moved, rebuild every index that is kept in memory
+        for key in list(self._indexes):
+            self.create_index(key)
+        return True
+
+
+    def create_index(self, key:str)->bool:
+        """
+        Create an index on `key` so that `find(key, value)` reads only the matching rows instead of scanning the file.
+        The index is saved beside the database as `<db_name>.<key>.idx` and kept up to date by insert, update and delete.
+        ```python
+        db = CSVDatabase('user.csv',['id','name','age'])
+        db.create_index('id')
+        db.find('id', 1)
+        ```
+        """
+        if key not in self._headers_set:
+            raise KeyError(f"Field '{key}' does not exist in the database headers.")
+        col_idx = self._header_index[key]
+        index = {}
+        for offset, raw in self._records(self._open_mmap()):
+            if self._is_tombstone(raw):
+                continue
+            fields = next(csv.reader([raw.decode('UTF-8')], quoting=csv.QUOTE_MINIMAL))
+            index.setdefault(self._auto_cast(fields[col_idx]), []).append(offset)
+        self._save_index(key, index)
+        return True
+
+
+    def register_column(self, key:str, caster=None)->bool:
+        """
+        Cast the values of column `key` with `caster` (e.g. `int`, `float`, `str`) instead of guessing the type.
+        Rows passed to conditions and returned by reads then already hold the right type, so a condition like
+        `lambda row: row["age"] > 25` needs no `int()`, and string values in dictionary conditions are cast too.
+        With the column cache on, the cast values of the column are kept so repeated reads do not cast again.
+        `find` on a registered column does not use the `create_index` index. Pass `caster=None` to go back to auto casting.
+        Empty cells (missing values, see `fill_missing`) never reach the caster and stay "", so `int` does not fail on them.
+        ```python
+        db = CSVDatabase('user.csv',['id','name','zip'])
+        db.register_column('zip', str)  # keep leading zeros of '00123'
+        ```
+        """
+        if key not in self._headers_set:
+            raise KeyError(f"Field '{key}' does not exist in the database headers.")
+        if caster is not None and not callable(caster):
+            raise TypeError(f"Caster for '{key}' must be callable, got {caster!r}")
+        if caster is None:
+            self._casters.pop(key, None)
+        else:
+            self._casters[key] = caster
+        self._cast_fns = tuple(self._keep_empty(self._casters[h]) if h in self._casters else self._auto_cast
+                               for h in self._headers_tuple)
+        self._cast_columns = {}
+        return True
+
+
+    def close(self):
+        """
+        Release the file descriptor kept open for inserts and the memory map used by reads.
+        They are reopened on the next call, `with CSVDatabase(...) as db:` closes them automatically.
+        """
+        self._close_mmap()
+        self._close_appender()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(dict.fromkeys(self._HANDLES))
+        # a copy registers casters and patches indexes on its own, without touching the original's
+        state['_casters'] = dict(self._casters)
+        if '_indexes' in state:
+            state['_indexes'] = {key: (stamp, {value: list(offsets) for value, offsets in index.items()})
+                                 for key, (stamp, index) in self._indexes.items()}
+            state['_cast_columns'] = dict(self._cast_columns)
+        return state
+
+
+    def __exit__(self, *exc):
+        self.close()
 
 
     def delete_db(self)->bool:
         """
         Delete whole database. Make sure to backup your database before running this method. It wipe out everything
         """
+        self.close()
+        for path in glob.glob(glob.escape(self.db_name) + '.*.idx'):
+            os.remove(path)
+        self._indexes = {}
         if os.path.exists(self.db_name):
             os.remove(self.db_name)
             return True
@@ -278,7 +584,7 @@ class CSVDatabase:
         """
         import json
         try:
-            with open(self.db_name, 'r', newline='', encoding='UTF-8') as f:
+            with open(self.db_name, 'r', newline='', encoding='UTF-8', buffering=self.READ_BUFFER) as f:
                 headers = f.readline().strip().split(",")
                 data = [dict(zip(headers, [self._auto_cast(l) for l in line.strip().split(",")])) for line in f if line.strip()]
             return json.dumps(data, indent=indent)
@@ -296,7 +602,7 @@ class CSVDatabase:
         mydb.to_html()
         ```"""
         try:
-            with open(self.db_name, 'r', newline='', encoding='UTF-8') as f:
+            with open(self.db_name, 'r', newline='', encoding='UTF-8', buffering=self.READ_BUFFER) as f:
                 lines = [line.strip().split(",") for line in f if line.strip()]
                 if not lines:
                     return '<table></table>'
@@ -314,31 +620,576 @@ class CSVDatabase:
 
     #private function to match condition and perform update & delete operation
     def _match(self, row, condition):
-        """_match checks if a row satisfies the given condition.
-        Supports function or dictionary as condition.
-        Auto-casts row values for type-safe comparisons.
+        """_match checks if a row satisfies a callable condition.
+        `row` must already be auto-casted, see `_cast_row`.
         """
-        # Apply auto_cast to row values
-        casted_row = {k: self._auto_cast(v) for k, v in row.items()}
+        try:
+            return condition(row)
+        except Exception as e:
+            raise RuntimeError(f"Error in condition function: {e}") from e
+
+
+    def _check_condition(self, condition):
+        """Validate a condition once before any row is read"""
         if callable(condition):
+            return
+        if not isinstance(condition, dict):
+            raise TypeError("Condition must be a dictionary or a callable function. Provided condition doesn't match.")
+        if not condition:
+            raise ValueError(f"""Provided dictionary is an empty
+                Your input: {condition}
+                Check wether something missing in your input.""")
+        for k in condition:
+            if k not in self._headers_set:
+                raise ValueError(f"Invalid key in condition: '{k}' — Not found in fields")
+
+
+    def _compile_condition(self, condition):
+        """Return a predicate over the positional fields of a row.
+        A dictionary becomes one generated expression that casts and compares only its own columns,
+        e.g. `lambda f: len(f) > 2 and c0(f[0]) == v0 and c1(f[2]) == v1`.
+        String values of registered columns are cast with the column caster first."""
+        self._check_condition(condition)
+        if callable(condition):
+            return lambda fields: self._match(self._cast_row(fields), condition)
+        namespace = {}
+        checks = []
+        for i, (k, v) in enumerate(condition.items()):
+            namespace[f'c{i}'] = cast = self._cast_fns[self._header_index[k]]
+            if k in self._casters and isinstance(v, str):
+                v = cast(v)
+            namespace[f'v{i}'] = v
+            checks.append(f"c{i}(f[{self._header_index[k]}]) == v{i}")
+        last = max(self._header_index[k] for k in condition)
+        return eval(f"lambda f: len(f) > {last} and " + " and ".join(checks), namespace)
+
+
+    def _select(self, rows, condition)->list:
+        """Return the casted rows out of positional `rows` that satisfy `condition`"""
+        return list(self._iter_select(rows, condition))
+
+
+    def _iter_select(self, rows, condition):
+        """Lazy `_select`, the condition is still validated right away"""
+        if isinstance(condition, dict):
+            predicate = self._compile_condition(condition)
+            return (self._cast_row(fields) for fields in rows if predicate(fields))
+        self._check_condition(condition)
+        return (row for row in map(self._cast_row, rows) if self._match(row, condition))
+
+
+    def _find_where_pandas(self, condition:dict)->list:
+        """find_where for dictionary conditions with pandas. Values are compared the same way as `_compile_condition`:
+        the column caster runs once per distinct value of a condition column, and the rows are selected
+        with a vectorized `isin` mask instead of a python comparison per row."""
+        self._check_condition(condition)
+        df = self._frame()
+        mask = pd.Series(True, index=df.index)
+        for k, v in condition.items():
+            column = df[k]
+            cast = self._cast_fns[self._header_index[k]]
+            if k in self._casters and isinstance(v, str):
+                v = cast(v)
+            hits = [raw for raw in column.unique() if cast(raw) == v]
+            mask &= column.isin(hits)
+        return self._frame_rows(df[mask])
+
+
+    def _find_where_parallel(self, condition:bytes, workers:int)->list:
+        """find_where over record aligned byte ranges of the file, each scanned by a worker process.
+        `condition` is the pickled condition and column casters, loaded once per worker."""
+        chunks = self._chunks(workers)
+        if not chunks:
+            return []
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_worker,
+                                 initargs=(self.db_name, condition)) as pool:
+            starts, ends = zip(*chunks)
+            return [row for rows in pool.map(_find_where_chunk, starts, ends) for row in rows]
+
+
+    def _chunks(self, parts:int)->list:
+        """Split the records after the header into about `parts` `(start, end)` byte ranges.
+        Ranges end on a newline, or on a record offset when quoted fields may hold newlines."""
+        mm = self._open_mmap()
+        mm.seek(0)
+        self._read_record(mm)
+        start, size = mm.tell(), len(mm)
+        offsets = self._record_offsets() if mm.find(b'"', start) != -1 else None
+        bounds = [start]
+        for i in range(1, parts):
+            pos = start + (size - start) * i // parts
+            if offsets is None:
+                pos = mm.find(b'\n', pos) + 1 or size
+            else:
+                j = bisect.bisect_left(offsets, pos)
+                pos = offsets[j] if j < len(offsets) else size
+            if pos > bounds[-1]:
+                bounds.append(pos)
+        if size > bounds[-1]:
+            bounds.append(size)
+        return list(zip(bounds, bounds[1:]))
+
+
+    def _frame(self):
+        """Load the live rows of the database into a pandas DataFrame of strings"""
+        if pd is None:
+            raise ImportError("This method requires pandas. Install it with: pip install pandas")
+        # tombstones read as blank lines, which pandas skips, usecols keeps pandas from
+        # reading the extra fields of a ragged row as data or index columns
+        return pd.read_csv(self.db_name, dtype=str, keep_default_na=False, encoding='UTF-8',
+                           usecols=list(self._headers_tuple))[list(self._headers_tuple)]
+
+
+    def _frame_rows(self, df)->list:
+        """Rows of a DataFrame from `_frame` as auto-casted dicts, same as the python read paths return"""
+        return [self._cast_row(fields) for fields in df.itertuples(index=False, name=None)]
+
+
+    def _write_rows(self, rows:list):
+        """Append validated positional rows with one csv.writer.writerows call and update the indexes"""
+        self._close_mmap()
+        self._sync_indexes()
+        offset = os.path.getsize(self.db_name)
+        with open(self.db_name, mode='a', newline='', encoding='UTF-8', buffering=1<<23) as f:
+            csv.writer(f, quoting=csv.QUOTE_MINIMAL).writerows(rows)
+        if self._indexes:
+            added = []
+            with open(self.db_name, 'rb', buffering=self.READ_BUFFER) as f:
+                f.seek(offset)
+                for fields in rows:
+                    added.append((f.tell(), fields))
+                    self._read_record(f)
+            self._reindex(added=added)
+
+
+    def _cast_row(self, fields)->dict:
+        """Build the casted dict of one row straight from its positional fields"""
+        if not self._casters:
+            return dict(zip(self._headers_tuple, map(self._auto_cast, fields)))
+        return dict(zip(self._headers_tuple, (cast(raw) for cast, raw in zip(self._cast_fns, fields))))
+
+
+    def _set_headers(self):
+        """Header order, positions and casters, computed once for the positional read/write paths"""
+        self._headers_tuple = tuple(self.headers)
+        self._header_index = {h: i for i, h in enumerate(self._headers_tuple)}
+        self._headers_set = frozenset(self._headers_tuple)
+        self._casters = {}
+        self._cast_fns = (self._auto_cast,) * len(self._headers_tuple)
+
+
+    def _appender(self)->int:
+        """File descriptor opened once with O_APPEND and reused by insert. Every os.write on it
+        lands at the current end of file as a whole, even with other processes appending too.
+        It is reopened once vacuum (here or in another instance) has replaced the file under it,
+        and closed when the object is garbage collected."""
+        if self._append_fd is not None:
+            held, current = os.fstat(self._append_fd), os.stat(self.db_name)
+            if (held.st_ino, held.st_dev) != (current.st_ino, current.st_dev):
+                self._close_appender()
+        if self._append_fd is None:
+            self._append_fd = os.open(self.db_name, os.O_WRONLY | os.O_APPEND | getattr(os, 'O_BINARY', 0))
+            self._append_finalizer = weakref.finalize(self, os.close, self._append_fd)
+        return self._append_fd
+
+
+    def _close_appender(self):
+        if self._append_fd is not None:
+            self._append_finalizer()
+            self._append_fd = self._append_finalizer = None
+
+
+    def _render(self, fields)->bytes:
+        """Encode one record exactly like csv.writer with QUOTE_MINIMAL and its default CRLF terminator"""
+        if len(fields) == 1 and fields[0] in (None, ''):
+            # csv.writer quotes a lone empty field so the record is not a blank line
+            return b'""\r\n'
+        return (','.join(map(self._csv_escape, fields)) + '\r\n').encode('UTF-8')
+
+
+    @staticmethod
+    def _csv_escape(value)->str:
+        """Quote a field only when it holds a comma, quote or line break, doubling inner quotes"""
+        value = '' if value is None else str(value)
+        if '"' in value:
+            return '"' + value.replace('"', '""') + '"'
+        if ',' in value or '\n' in value or '\r' in value:
+            return '"' + value + '"'
+        return value
+
+
+    # in-place mutation with tombstones
+    def _mutate(self, select, transform=None)->bool:
+        """_mutate deletes (no `transform`) or updates every record where `select(fields)` is True.
+        Deleted records are overwritten with a same-length tombstone. Updated records are
+        written in place when the byte length is unchanged, else tombstoned and appended.
+        Records are read and overwritten through one writable memory map, the matches are
+        collected first so nothing is written when `select` raises.
+        """
+        self._close_mmap()
+        self._sync_indexes()
+        # fields are only needed to transform a row or to update the indexes
+        keep_fields = transform is not None or bool(self._indexes)
+        removed, added, appended = [], [], []
+        with open(self.db_name, 'r+b') as f:
+            with mmap.mmap(f.fileno(), 0) as mm:
+                self._advise(mm, 'MADV_SEQUENTIAL')
+                matched = []
+                live = tombstones = 0
+                for offset, raw in self._records(mm):
+                    if self._is_tombstone(raw):
+                        tombstones += 1
+                        continue
+                    live += 1
+                    fields = next(csv.reader([raw.decode('UTF-8')], quoting=csv.QUOTE_MINIMAL))
+                    if select(fields):
+                        matched.append((offset, len(raw), raw.endswith(b'\r\n'), fields if keep_fields else None))
+                if not matched:
+                    self._tombstones = tombstones
+                    return False
+                for offset, length, crlf, fields in matched:
+                    if self._indexes:
+                        removed.append((offset, fields))
+                    if transform is not None:
+                        new_fields = transform(fields)
+                        new_raw = self._serialize(new_fields, '\r\n' if crlf else '\n')
+                        if len(new_raw) == length:
+                            mm[offset:offset + length] = new_raw
+                            added.append((offset, new_fields))
+                            continue
+                        appended.append((new_raw, new_fields))
+                    mm[offset:offset + length] = self._tombstone(length)
+                    tombstones += 1
+            if appended:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+                for new_raw, new_fields in appended:
+                    added.append((f.tell(), new_fields))
+                    f.write(new_raw)
+                live += len(appended)
+        self._touch()
+        self._tombstones = tombstones
+        if self._tombstones > self.TOMBSTONE_RATIO * (live + tombstones):
+            self.vacuum()
+        else:
+            self._reindex(removed, added)
+        return True
+
+
+    def _merge(self, fields, new_data):
+        """Return `fields` as a list ordered by headers with `new_data` applied on top.
+        None is written as an empty cell, like csv.DictWriter does."""
+        row = dict(zip(self.headers, fields))
+        row.update({k: "" if v is None else str(v) for k, v in new_data.items()})
+        return [row.get(h, "") for h in self.headers]
+
+
+    def _serialize(self, fields, lineterminator='\r\n')->bytes:
+        """Render one record the same way insert writes it."""
+        buf = io.StringIO()
+        csv.writer(buf, quoting=csv.QUOTE_MINIMAL, lineterminator=lineterminator).writerow(fields)
+        return buf.getvalue().encode('UTF-8')
+
+
+    def _records(self, f):
+        """Yield `(offset, raw_bytes)` for every record after the header of binary file `f`."""
+        f.seek(0)
+        self._read_record(f)
+        while True:
+            offset = f.tell()
+            raw = self._read_record(f)
+            if not raw:
+                return
+            yield offset, raw
+
+
+    @staticmethod
+    def _read_record(f)->bytes:
+        """Read one record, it can span multiple lines when a quoted field holds a newline."""
+        raw = f.readline()
+        while raw.count(b'"') % 2:
+            line = f.readline()
+            if not line:
+                break
+            raw += line
+        return raw
+
+
+    @staticmethod
+    def _tombstone(length:int)->bytes:
+        """A tombstone is a line of carriage returns with the same byte length as the record it replaces.
+        csv.writer never writes a record without fields (a lone empty field is written as `""`)
+        and quotes every field holding a carriage return, so no real row reads back as one,
+        not even a row of empty fields. csv readers and pandas see it as blank lines."""
+        return b'\r' * (length - 1) + b'\n'
+
+
+    @staticmethod
+    def _is_tombstone(raw:bytes)->bool:
+        """Tombstone or blank line"""
+        return not raw.strip(b'\r\n')
+
+
+    # memory mapped read path
+    def _open_mmap(self)->mmap.mmap:
+        """Return a read-only memory map of the database. The map is reused across
+        reads and reopened after a write or when the file stamp changes."""
+        stamp = self._file_stamp()
+        if self._mmap is None or self._mmap_stamp != stamp:
+            self._close_mmap()
+            with open(self.db_name, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mmap_stamp = stamp
+        return self._mmap
+
+
+    @staticmethod
+    def _advise(mm:mmap.mmap, *advice:str):
+        """Pass access pattern hints to the kernel for the mapped pages, skipped where madvise is not available"""
+        if not hasattr(mm, 'madvise'):
+            return
+        for name in advice:
+            if hasattr(mmap, name):
+                mm.madvise(getattr(mmap, name))
+
+
+    @staticmethod
+    def _hint_sequential(f):
+        """Tell the kernel file `f` is read front to back so it widens read-ahead (POSIX only)"""
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+    def _file_stamp(self)->tuple:
+        """`(st_mtime_ns, st_size)` of the database from one stat call. Every in-memory cache
+        (memory map, column cache, indexes) remembers the stamp it was built from and is rebuilt
+        when it no longer matches, which also catches changes made by other processes."""
+        st = os.stat(self.db_name)
+        return (st.st_mtime_ns, st.st_size)
+
+
+    def _touch(self):
+        """Set the mtime to the precise current time. In-place writes keep the size and may land
+        within the same coarse filesystem timestamp, this makes sure they change the stamp."""
+        now = time.time_ns()
+        os.utime(self.db_name, ns=(now, now))
+
+
+    def _close_mmap(self):
+        """Invalidate the memory map and the column cache, every write operation must call it first"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._mmap_stamp = None
+        self._offsets = None
+        self._columns = None
+        self._cast_columns = {}
+
+
+    def _scan(self, build:bool=False):
+        """Yield the fields of every live row, from the column cache when it is warm.
+        Only find_all builds the cache (`build`), other reads stream through `_parse`
+        so a selective query does not leave the whole file in memory."""
+        columns = self._column_cache(build)
+        if columns is None:
+            yield from self._parse()
+        else:
+            yield from zip(*columns)
+
+
+    def _column_cache(self, build:bool=True):
+        """Return the live rows as a tuple of one list of raw values per header.
+        It is built on first use with `build`, dropped by every write and rebuilt when the
+        file was changed by another process. None when `COLUMN_CACHE` is off or not built."""
+        if not self.COLUMN_CACHE:
+            return None
+        stamp = self._file_stamp()
+        if self._columns is not None and self._columns_stamp == stamp:
+            return self._columns
+        if not build:
+            return None
+        width = len(self._headers_tuple)
+        columns = tuple([] for _ in range(width))
+        appends = [column.append for column in columns]
+        for fields in self._parse():
+            if len(fields) != width:
+                fields = (fields + [""] * width)[:width]
+            for append, raw in zip(appends, fields):
+                append(raw)
+        self._columns, self._columns_stamp = columns, stamp
+        self._cast_columns = {}
+        return columns
+
+
+    def _cast_column(self, col_idx:int, build:bool=True)->list|None:
+        """Values of a column cast once with its caster and kept with the column cache.
+        None when the cache is off, or not built yet and `build` is False"""
+        columns = self._column_cache(build)
+        if columns is None:
+            return None
+        if col_idx not in self._cast_columns:
+            self._cast_columns[col_idx] = list(map(self._cast_fns[col_idx], columns[col_idx]))
+        return self._cast_columns[col_idx]
+
+
+    def _parse(self):
+        """Yield the fields of every live row, parsed directly out of the memory map"""
+        mm = self._open_mmap()
+        self._advise(mm, 'MADV_SEQUENTIAL', 'MADV_WILLNEED')
+        mm.seek(0)
+        self._read_record(mm)
+        yield from self._parse_range(mm.tell(), len(mm))
+
+
+    def _parse_range(self, start:int, end:int, mm:mmap.mmap|None=None):
+        """Yield the fields of every live row in the record aligned byte range `[start, end)`
+        of `mm`, the shared memory map by default"""
+        if mm is None:
+            mm = self._open_mmap()
+        mm.seek(start)
+        lines = (mm.readline().decode('UTF-8') for _ in iter(lambda: mm.tell() < end, False))
+        for fields in csv.reader(lines, quoting=csv.QUOTE_MINIMAL):
+            if fields:
+                yield fields
+
+
+    def _stream(self):
+        """Yield the fields of every live row for the iter_* methods. A warm column cache is used as
+        a snapshot, otherwise the file is parsed through a private memory map that stays valid
+        when a write during the iteration closes the shared one."""
+        columns = self._column_cache(build=False)
+        if columns is not None:
+            yield from zip(*columns)
+            return
+        with open(self.db_name, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            self._advise(mm, 'MADV_SEQUENTIAL')
+            self._read_record(mm)
+            yield from self._parse_range(mm.tell(), len(mm), mm)
+
+
+    def _record_offsets(self)->list:
+        """Byte offsets of every record after the header, built once per memory map"""
+        mm = self._open_mmap()
+        if self._offsets is None:
+            self._offsets = [offset for offset, _ in self._records(mm)]
+        return self._offsets
+
+
+    def _candidates(self, needle:bytes):
+        """Yield raw records that contain `needle`, located with mmap.find before any csv parsing.
+        Lines are expanded to whole records with the offset index when the file has quoted fields,
+        because a quoted field may hold a newline."""
+        mm = self._open_mmap()
+        self._advise(mm, 'MADV_SEQUENTIAL')
+        offsets = self._record_offsets() if mm.find(b'"', 0) != -1 else None
+        mm.seek(0)
+        self._read_record(mm)
+        pos = mm.tell()
+        while True:
+            hit = mm.find(needle, pos)
+            if hit == -1:
+                return
+            if offsets is None:
+                start = mm.rfind(b'\n', 0, hit) + 1
+                end = mm.find(b'\n', hit) + 1 or len(mm)
+            else:
+                i = bisect.bisect_right(offsets, hit) - 1
+                start = offsets[i]
+                end = offsets[i + 1] if i + 1 < len(offsets) else len(mm)
+            yield mm[start:end]
+            pos = end
+
+
+    # persistent indexes, see create_index
+    def _index_path(self, key:str)->str:
+        return f"{self.db_name}.{key}.idx"
+
+
+    def _save_index(self, key:str, index:dict):
+        """Pickle `index` with the database stamp, a different stamp means the index is stale"""
+        stamp = self._file_stamp()
+        with open(self._index_path(key), 'wb', buffering=self.READ_BUFFER) as f:
+            pickle.dump({'stamp': stamp, 'index': index}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._indexes[key] = (stamp, index)
+
+
+    def _get_index(self, key:str)->dict|None:
+        """Return the index of `key`, reloading or rebuilding it when the database has changed. None if not indexed"""
+        stamp = self._file_stamp()
+        if key in self._indexes and self._indexes[key][0] == stamp:
+            return self._indexes[key][1]
+        path = self._index_path(key)
+        if not os.path.exists(path):
+            self._indexes.pop(key, None)
+            return None
+        with open(path, 'rb', buffering=self.READ_BUFFER) as f:
+            saved = pickle.load(f)
+        if saved['stamp'] != stamp:
+            self.create_index(key)
+        else:
+            self._indexes[key] = (stamp, saved['index'])
+        return self._indexes[key][1]
+
+
+    def _sync_indexes(self):
+        """Called right before a write. An in-memory index that missed a write by another
+        instance can't be patched by `_reindex`, so it is swapped for the saved one when that
+        is current, else dropped and left to `_get_index` to rebuild on the next lookup.
+        Returns the stamp the kept indexes match, None without indexes."""
+        if not self._indexes:
+            return None
+        stamp = self._file_stamp()
+        for key, (indexed, _) in list(self._indexes.items()):
+            if indexed == stamp:
+                continue
+            del self._indexes[key]
             try:
-                return condition(casted_row)
-            except Exception as e:
-                raise RuntimeError(f"Error in condition function: {e}") from e
-        elif isinstance(condition, dict):
-            if not condition:
-                raise ValueError("""Provided dictionary is an empty
-                    Your input: {condition}
-                    Check wether something missing in your input.""")
-            for k in condition:
-                if k not in self.headers:
-                    raise ValueError(f"Invalid key in condition: '{k}' — Not found in fields")
-            return all(casted_row.get(k) == v for k, v in condition.items())
-        raise TypeError("Condition must be a dictionary or a callable function. Provided condition doesn't match.")
+                with open(self._index_path(key), 'rb', buffering=self.READ_BUFFER) as f:
+                    saved = pickle.load(f)
+            except FileNotFoundError:
+                continue
+            if saved['stamp'] == stamp:
+                self._indexes[key] = (stamp, saved['index'])
+        return stamp
+
+
+    def _reindex(self, removed=(), added=()):
+        """Apply written rows to the in-memory indexes and save them.
+        `removed` and `added` are lists of `(offset, fields)`, only indexes that were
+        current before the write are here, see `_sync_indexes`."""
+        for key, (_, index) in list(self._indexes.items()):
+            col_idx = self._header_index[key]
+            for offset, fields in removed:
+                offsets = index.get(self._auto_cast(fields[col_idx]), [])
+                if offset in offsets:
+                    offsets.remove(offset)
+            for offset, fields in added:
+                value = fields[col_idx]
+                value = self._auto_cast("" if value is None else str(value))
+                bisect.insort(index.setdefault(value, []), offset)
+            self._save_index(key, index)
+
+
+    def _read_at(self, offsets):
+        """Yield the decoded records starting at each byte offset"""
+        mm = self._open_mmap()
+        self._advise(mm, 'MADV_RANDOM')
+        for offset in offsets:
+            mm.seek(offset)
+            yield self._read_record(mm).decode('UTF-8')
+
+
+    @staticmethod
+    def _keep_empty(caster):
+        """Wrap a registered caster so empty cells stay "" like `_auto_cast` leaves them.
+        A partial of a module level function keeps the database picklable."""
+        return functools.partial(_cast_non_empty, caster)
 
 
     # advance feature - type casting for more better filter
-    def _auto_cast(self, value):
+    @staticmethod
+    def _auto_cast(value):
         """This function try to cast value to boolean, integer or float. If value is not castable then return in string"""
         if value.lower() in {"true", "false"}:
             return value.lower() == "true"
@@ -357,4 +1208,310 @@ class CSVDatabase:
         with open(self.db_name, mode='r', newline='', encoding='UTF-8') as f:
             reader = csv.reader(f)
             default_headers = next(reader)
-            self.headers = default_headers
\ No newline at end of file
+            self.headers = default_headers
+
+
+def _cast_non_empty(caster, raw):
+    """Registered caster call that leaves empty cells as "", see CSVDatabase._keep_empty"""
+    return raw if raw == "" else caster(raw)
+
+
+# worker process side of find_where(..., parallel=True)
+_worker = None
+
+
+def _init_worker(db_name:str, condition:bytes):
+    """Open the database once per worker process and load the pickled condition and column casters"""
+    global _worker
+    db = CSVDatabase(db_name)
+    condition, casters = pickle.loads(condition)
+    for key, caster in casters.items():
+        db.register_column(key, caster)
+    _worker = (db, condition)
+
+
+def _find_where_chunk(start:int, end:int)->list:
+    """Return the casted rows in `[start, end)` that match the worker condition"""
+    db, condition = _worker
+    return db._select(db._parse_range(start, end), condition)
+
+
+class _SQLiteBackend(CSVDatabase):
+    """CSVDatabase API stored in a SQLite file, created with `CSVDatabase(name, headers, backend='sqlite')`.
+    Values are kept as text exactly like in the CSV file and auto-casted on read, so both backends
+    return the same results. SQL narrows lookups down and runs in WAL mode, which suits
+    mutation heavy or concurrent workloads that outgrow rewriting a CSV file."""
+
+    TABLE = 'datacsv'
+    _HANDLES = ('_conn',)
+
+    def __init__(self, db_name: str, headers:Collection[str]=[], backend:str='sqlite'):
+        base = db_name[:-4] if db_name.endswith(".csv") else db_name
+        self.db_name = base if base.endswith(".db") else base + ".db"
+        self._conn = None
+        exists = os.path.exists(self.db_name)
+        if exists:
+            self.headers = [info[1] for info in self._connect().execute(f"PRAGMA table_info({self._quote(self.TABLE)})")]
+            if not self.headers:
+                raise FileNotFoundError(f"""CSVDatabase: Database is empty. provide fields to create it.\n
+                                    Your database should not be empty\n
+                                    Create new database with: db = CSVDatabase('{base}',['field1,'field2','field3'], backend='sqlite')""")
+        elif headers:
+            self.headers = headers
+            columns = ", ".join(f"{self._quote(h)} TEXT" for h in headers)
+            self._connect().execute(f"CREATE TABLE {self._quote(self.TABLE)} ({columns})")
+        else:
+            raise ValueError("""CSVDatabase: Database does not exist, provide fields to create it.
+                                You must provide Database name in String and fields in List 
+                                For example: db = CSVDatabase('my_database',['field1,'field2','field3'], backend='sqlite')""")
+        self._set_headers()
+        self._select_sql = f"SELECT rowid, {', '.join(map(self._quote, self._headers_tuple))} FROM {self._quote(self.TABLE)}"
+
+
+    def insert(self, row:dict, fill_missing:bool=False)-> bool:
+        """Perform single insert operation to database, see `CSVDatabase.insert`"""
+        return self.insert_many([row], fill_missing)
+
+
+    def find_all(self, key: str|None = None) -> list:
+        """Return all rows, or all values of `key`, see `CSVDatabase.find_all`"""
+        if key is not None:
+            if key not in self._headers_set:
+                raise KeyError(f"Field '{key}' does not exist in the database headers.")
+            col_idx = self._header_index[key]
+            cast = self._cast_fns[col_idx]
+            return [cast(fields[col_idx]) for fields in self._rows()]
+        return [self._cast_row(fields) for fields in self._rows()]
+
+
+    def find(self, key:str, value:str|int|float|bool):
+        """Find row(s) where `key` equals `value`, see `CSVDatabase.find`. `create_index(key)` makes it an index lookup."""
+        if not key or not value:
+            raise ValueError("""You must provide valid key and value to run find method.
+            Your input data: KEY: {key} AND VALUE: {value}
+            Key or value is missing in your inputs""")
+        if key not in self._headers_set:
+            raise KeyError(f"Field '{key}' does not exist in the database headers.")
+        return self._select(self._rows({key: value}), {key: value})
+
+
+    def find_where(self, condition, engine:str='python', parallel:bool|int=False)->list:
+        """Filter rows with a function or dictionary, see `CSVDatabase.find_where`.
+        Dictionaries are turned into a SQL WHERE clause, functions are checked row by row.
+        `engine` and `parallel` are accepted for compatibility and ignored."""
+        if condition is None:
+            raise TypeError("Your condition function is none. Function should not be none")
+        self._check_condition(condition)
+        return self._select(self._rows(condition if isinstance(condition, dict) else None), condition)
+
+
+    def iter_where(self, condition):
+        """Lazy find_where(), see `CSVDatabase.iter_where`"""
+        if condition is None:
+            raise TypeError("Your condition function is none. Function should not be none")
+        self._check_condition(condition)
+        return self._iter_select(self._rows(condition if isinstance(condition, dict) else None), condition)
+
+
+    def find_where_typed(self, key:str, op:str, value:int|float)->list:
+        """Filter on a numeric column with one comparison, see `CSVDatabase.find_where_typed`"""
+        if op not in self._OPERATORS:
+            raise ValueError(f"Unknown operator '{op}', use one of {list(self._OPERATORS)}")
+        if key not in self._headers_set:
+            raise KeyError(f"Field '{key}' does not exist in the database headers.")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"find_where_typed compares numbers only, got {value!r}")
+        compare, col_idx = self._OPERATORS[op], self._header_index[key]
+        def numeric(raw):
+            cast = self._auto_cast(raw)
+            return not isinstance(cast, bool) and isinstance(cast, (int, float)) and compare(cast, value)
+        return [self._cast_row(fields) for fields in self._rows() if numeric(fields[col_idx])]
+
+
+    def delete(self, key:str, value:str|int|float|bool) -> bool:
+        """Delete rows where `key` equals `value`"""
+        if key not in self._headers_set:
+            raise KeyError(f"Invalid column name '{key}'")
+        return self._mutate(self._compile_condition({key: value}), where={key: value})
+
+
+    def delete_where(self, condition)-> bool:
+        """Delete rows matching a function or dictionary, see `CSVDatabase.delete_where`"""
+        if condition is None:
+            raise TypeError("The condition must be a valid dictionary or function. None provided.")
+        return self._mutate(self._compile_condition(condition), where=condition if isinstance(condition, dict) else None)
+
+
+    def update(self, key:str, value:str|int|float|bool, new_data: dict)->bool:
+        """Update rows where the stored text of `key` equals `value`, see `CSVDatabase.update`"""
+        for k in new_data:
+            if k not in self._headers_set:
+                raise KeyError(f"Invalid column name: '{k}'")
+        if key not in self._headers_set:
+            return False
+        col_idx = self._header_index[key]
+        rows = self._connect().execute(f"{self._select_sql} WHERE {self._quote(key)} = ?", (value,))
+        return self._mutate(lambda fields: fields[col_idx] == value, lambda fields: self._merge(fields, new_data), rows=rows)
+
+
+    def update_where(self, condition, new_data:dict):
+        """Update rows matching a function or dictionary, see `CSVDatabase.update_where`"""
+        if not isinstance(new_data, dict) or not new_data:
+            raise ValueError("new_data must be a non-empty dictionary.")
+        for k in new_data:
+            if k not in self._headers_set:
+                raise KeyError(f"Invalid column name: '{k}'")
+        return self._mutate(self._compile_condition(condition), lambda fields: self._merge(fields, new_data),
+                            where=condition if isinstance(condition, dict) else None)
+
+
+    def vacuum(self)->bool:
+        """Rebuild the SQLite file to reclaim the space of deleted rows"""
+        self._connect().execute("VACUUM")
+        return True
+
+
+    def create_index(self, key:str)->bool:
+        """Create SQL indexes on `key` so that `find(key, value)` and dictionary conditions on it use an index lookup.
+        One index serves text values, one on CAST(key AS NUMERIC) serves numbers and one on lower(key) booleans."""
+        if key not in self._headers_set:
+            raise KeyError(f"Field '{key}' does not exist in the database headers.")
+        table, column = self._quote(self.TABLE), self._quote(key)
+        with self._connect() as conn:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self._quote(f'{self.TABLE}_{key}_idx')} ON {table} ({column})")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self._quote(f'{self.TABLE}_{key}_num_idx')} "
+                         f"ON {table} (CAST({column} AS NUMERIC))")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self._quote(f'{self.TABLE}_{key}_lower_idx')} "
+                         f"ON {table} (lower({column}))")
+        return True
+
+
+    def close(self):
+        """Close the SQLite connection, it is reopened on the next call"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+    def delete_db(self)->bool:
+        """Delete whole database together with its WAL files. It wipe out everything"""
+        self.close()
+        for path in (self.db_name + "-wal", self.db_name + "-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+        if os.path.exists(self.db_name):
+            os.remove(self.db_name)
+            return True
+        return False
+
+
+    def to_json(self, indent:int|None=2):
+        """Export the database as JSON string, see `CSVDatabase.to_json`"""
+        import json
+        return json.dumps(self.find_all(), indent=indent)
+
+
+    def to_html(self, table_class:str|None=None):
+        """Render the database as HTML table, see `CSVDatabase.to_html`"""
+        html =  f'<table border="1" class="{table_class}">\n,<tr>' if table_class else "<table border='1'>\n<tr>"
+        html += "".join(f"<th>{h}</th>" for h in self.headers) + "</tr>\n"
+        for row in self._rows():
+            html += "<tr>" + "".join(f"<td>{v}</td>" for v in row) + "</tr>\n"
+        html += "</table>"
+        return html
+
+
+    def _connect(self)->sqlite3.Connection:
+        """Open the connection once, in WAL mode so readers never block the writer"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_name)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+
+    @staticmethod
+    def _quote(name:str)->str:
+        return '"' + str(name).replace('"', '""') + '"'
+
+
+    @staticmethod
+    def _text(value)->str:
+        """Store values as the text csv.writer would write"""
+        return '' if value is None else str(value)
+
+
+    @staticmethod
+    def _narrow(column:str, value)->tuple|None:
+        """SQL clause and params that keep every row whose text `_auto_cast` reads back equal to `value`.
+        Numbers compare through CAST AS NUMERIC, so '7', '7.0' and '007' all match 7. The clause may
+        keep a few extra rows (CAST reads '7abc' as 7), matches are confirmed in python afterwards.
+        None when SQL can't narrow on `value`."""
+        if isinstance(value, int) and not -2**63 <= value < 2**63:
+            # sqlite integers are 64 bit, CAST reads longer numbers as REAL and so is the value bound
+            try:
+                value = float(value)
+            except OverflowError:
+                return None
+        if isinstance(value, (int, float)) and math.isfinite(value):
+            clause, params = f"CAST({column} AS NUMERIC) = ?", [value]
+            if value in (0, 1):
+                clause, params = f"({clause} OR lower({column}) = ?)", params + ["true" if value else "false"]
+            return clause, params
+        return f"{column} = ?", [value if isinstance(value, str) else str(value)]
+
+
+    def _query(self, condition:dict|None=None):
+        """Run the row select narrowed by a dictionary condition, rows come as `(rowid, *fields)`"""
+        if not condition:
+            return self._connect().execute(f"{self._select_sql} ORDER BY rowid")
+        clauses, params = [], []
+        for k, v in condition.items():
+            if k in self._casters:
+                # _narrow follows _auto_cast, a registered caster is only checked in python
+                continue
+            narrowed = self._narrow(self._quote(k), v)
+            if narrowed is None:
+                continue
+            clause, clause_params = narrowed
+            clauses.append(clause)
+            params.extend(clause_params)
+        if not clauses:
+            return self._connect().execute(f"{self._select_sql} ORDER BY rowid")
+        return self._connect().execute(f"{self._select_sql} WHERE {' AND '.join(clauses)} ORDER BY rowid", params)
+
+
+    def _rows(self, condition:dict|None=None):
+        """Yield the fields of every row, narrowed by a dictionary condition"""
+        for rowid, *fields in self._query(condition):
+            yield fields
+
+
+    def _stream(self):
+        """Rows for iter_all, streamed from a cursor"""
+        return self._rows()
+
+
+    def _write_rows(self, rows:list):
+        """Insert validated positional rows in one transaction"""
+        placeholders = ", ".join("?" * len(self._headers_tuple))
+        with self._connect() as conn:
+            conn.executemany(f"INSERT INTO {self._quote(self.TABLE)} VALUES ({placeholders})",
+                             ([self._text(v) for v in row] for row in rows))
+
+
+    def _mutate(self, select, transform=None, where:dict|None=None, rows=None)->bool:
+        """Delete (no `transform`) or update every row where `select(fields)` is True in one transaction.
+        Candidates come from `rows` or the select narrowed by the dictionary `where`."""
+        rows = self._query(where) if rows is None else rows
+        matched = [(rowid, fields) for rowid, *fields in rows if select(fields)]
+        if not matched:
+            return False
+        with self._connect() as conn:
+            if transform is None:
+                conn.executemany(f"DELETE FROM {self._quote(self.TABLE)} WHERE rowid = ?", ((rowid,) for rowid, _ in matched))
+            else:
+                assignments = ", ".join(f"{self._quote(h)} = ?" for h in self._headers_tuple)
+                conn.executemany(f"UPDATE {self._quote(self.TABLE)} SET {assignments} WHERE rowid = ?",
+                                 ([*map(self._text, transform(fields)), rowid] for rowid, fields in matched))
+        return True
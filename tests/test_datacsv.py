@@ -0,0 +1,149 @@
+import os
+import tempfile
+import unittest
+
+from datacsv.datacsv import CSVDatabase, pd
+
+
+class DatacsvTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "users")
+        self._dbs = []
+
+    def tearDown(self):
+        for db in self._dbs:
+            db.close()
+        self._tmp.cleanup()
+
+    def open(self, headers=(), backend='csv'):
+        db = CSVDatabase(self.path, list(headers), backend=backend)
+        self._dbs.append(db)
+        return db
+
+    def read_bytes(self):
+        with open(self.path + ".csv", 'rb') as f:
+            return f.read()
+
+
+class TombstoneTest(DatacsvTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db = self.open(['id', 'name'])
+        self.db.insert_many([{'id': i, 'name': f"n{i}"} for i in range(1, 9)])
+
+    def test_delete_leaves_same_length_tombstone(self):
+        size = len(self.read_bytes())
+        self.assertTrue(self.db.delete('id', 3))
+        data = self.read_bytes()
+        self.assertEqual(len(data), size)
+        self.assertIn(b'\r\r\r\r\n', data)
+        self.assertNotIn(b'n3', data)
+
+    def test_find_all_skips_tombstones(self):
+        self.db.delete('id', 3)
+        self.assertEqual([row['id'] for row in self.db.find_all()], [1, 2, 4, 5, 6, 7, 8])
+        self.assertEqual(self.db.find('name', 'n3'), [])
+        self.assertEqual([row['id'] for row in self.open().find_all()], [1, 2, 4, 5, 6, 7, 8])
+
+    def test_vacuum_drops_tombstones(self):
+        self.db.delete('id', 3)
+        self.db.vacuum()
+        self.assertNotIn(b'\r\r', self.read_bytes())
+        self.assertEqual([row['id'] for row in self.db.find_all()], [1, 2, 4, 5, 6, 7, 8])
+
+    def test_update_longer_row_moves_to_end(self):
+        self.assertTrue(self.db.update('id', '2', {'name': 'a much longer name'}))
+        self.assertEqual(self.db.find_all()[-1], {'id': 2, 'name': 'a much longer name'})
+        self.assertEqual(len(self.db.find_all()), 8)
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_pandas_engine_skips_tombstones(self):
+        self.db.delete('id', 1)
+        self.assertEqual(self.db.find_where({'name': 'n1'}, engine='pandas'), [])
+        self.assertEqual(len(self.db.find_where(lambda row: row['id'] > 0, engine='pandas')), 7)
+        self.assertEqual(self.db.find_where_typed('id', '<', 3), [{'id': 2, 'name': 'n2'}])
+
+
+class EmptyRowTest(DatacsvTestCase):
+
+    def test_all_empty_row_survives_delete(self):
+        db = self.open(['a', 'b'])
+        db.insert({'a': '', 'b': ''})
+        db.insert_many([{'a': '1', 'b': 'x'}, {'a': '2', 'b': 'y'}])
+        db.delete('a', 2)
+        expected = [{'a': '', 'b': ''}, {'a': 1, 'b': 'x'}]
+        self.assertEqual(db.find_all(), expected)
+        self.assertEqual(db.find_where({'a': ''}), [{'a': '', 'b': ''}])
+        db.vacuum()
+        self.assertEqual(self.open().find_all(), expected)
+        if pd is not None:
+            self.assertEqual(db.find_where({'a': ''}, engine='pandas'), [{'a': '', 'b': ''}])
+
+
+class IndexTest(DatacsvTestCase):
+
+    def test_index_sees_rows_of_another_instance(self):
+        a = self.open(['id', 'name'])
+        b = self.open()
+        a.insert({'id': 1, 'name': 'x'})
+        a.create_index('name')
+        b.insert({'id': 2, 'name': 'y'})
+        a.insert({'id': 3, 'name': 'z'})
+        self.assertEqual(a.find('name', 'y'), [{'id': 2, 'name': 'y'}])
+        self.assertEqual(self.open().find('name', 'y'), [{'id': 2, 'name': 'y'}])
+        self.assertEqual(b.find('name', 'z'), [{'id': 3, 'name': 'z'}])
+
+    def test_index_follows_delete_and_update(self):
+        a = self.open(['id', 'name'])
+        a.insert_many([{'id': i, 'name': f"n{i}"} for i in range(10)])
+        a.create_index('name')
+        b = self.open()
+        b.delete('id', 4)
+        b.update('id', '5', {'name': 'renamed'})
+        self.assertEqual(a.find('name', 'n4'), [])
+        self.assertEqual(a.find('name', 'renamed'), [{'id': 5, 'name': 'renamed'}])
+        self.assertEqual(a.find('name', 'n6'), [{'id': 6, 'name': 'n6'}])
+
+
+class BackendParityTest(DatacsvTestCase):
+
+    ROWS = [
+        {'id': 1, 'name': 'alice', 'age': 30, 'zip': '00123'},
+        {'id': 2, 'name': 'bob', 'age': 25, 'zip': '00456'},
+        {'id': 3, 'name': 'carol', 'age': '', 'zip': '007'},
+        {'id': 4, 'name': 'dave', 'age': 41.5, 'zip': 'true'},
+    ]
+
+    def run_backend(self, backend:str)->list:
+        db = CSVDatabase(os.path.join(self._tmp.name, backend), ['id', 'name', 'age', 'zip'], backend=backend)
+        self._dbs.append(db)
+        db.insert_many(self.ROWS)
+        db.create_index('zip')
+        results = [
+            db.find_all(),
+            db.find_all('age'),
+            db.find('zip', 7),
+            db.find('zip', True),
+            db.find('id', 10**20),
+            db.find_where({'name': 'bob'}),
+            db.find_where(lambda row: row['id'] > 2),
+            list(db.iter_where({'age': 25})),
+        ]
+        db.delete('id', 1)
+        db.update('id', '2', {'name': 'robert'})
+        db.update_where({'id': 3}, {'age': None})
+        results.append(sorted(db.find_all(), key=lambda row: row['id']))
+        db.register_column('zip', str)
+        results.append(db.find('zip', '007'))
+        results.append(db.find_where({'zip': '007'}))
+        return results
+
+    def test_csv_and_sqlite_match(self):
+        self.assertEqual(self.run_backend('csv'), self.run_backend('sqlite'))
+
+
+if __name__ == '__main__':
+    unittest.main()